@@ -16,10 +16,14 @@ from .compile import Compiler
 from .unicode_fix import fixup_unicode
 
 
+@functools.cache
+def _get_driver(grammar: Grammar) -> pygram.driver.Driver:
+    return pygram.driver.Driver(grammar)
+
+
 def parse(code: str, *, grammar: Grammar = pygram.python_grammar_soft_keywords) -> NL:
     """Parse the given code using the given grammar."""
-    driver = pygram.driver.Driver(grammar)
-    return driver.parse_string(code, debug=True)
+    return _get_driver(grammar).parse_string(code)
 
 
 def compile(
@@ -1,6 +1,7 @@
 """Compile a CST to an AST."""
 
 import ast
+import codecs
 import re
 import sys
 import types
@@ -14,7 +15,6 @@ from blib2to3 import pygram
 from blib2to3.pgen2 import token
 from blib2to3.pgen2.grammar import Grammar
 from blib2to3.pytree import NL, Leaf, Node
-from typing_extensions import TypedDict
 
 pygram.initialize(cache_dir=None)
 
@@ -22,6 +22,8 @@ T = TypeVar("T")
 U = TypeVar("U")
 
 LVB = Union[Leaf, ast.Constant, tuple[Leaf, Leaf]]
+# A 4-tuple of lineno, col_offset, end_lineno and end_col_offset.
+LineRange = tuple[int, int, int, int]
 
 
 class UnsupportedSyntaxError(Exception):
@@ -47,10 +49,22 @@ class Visitor(Generic[T]):
         else:
             return str(self.node_type_to_name[node.type])
 
+    @cached_property
+    def _dispatch_table(self) -> list[Callable[[Any, NL], T]]:
+        # Indexed by node type. Built per instance rather than per class,
+        # because symbol numbers depend on the grammar.
+        cls = type(self)
+        names = {
+            **{typ: name for typ, name in self.token_type_to_name.items() if typ < 256},
+            **self.node_type_to_name,
+        }
+        table: list[Callable[[Any, NL], T]] = [cls.generic_visit] * (max(names) + 1)
+        for typ, name in names.items():
+            table[typ] = getattr(cls, f"visit_{name}", cls.generic_visit)
+        return table
+
     def visit(self, node: NL) -> T:
-        name = self.get_node_name(node)
-        method = getattr(self, f"visit_{name}", self.generic_visit)
-        return method(node)
+        return self._dispatch_table[node.type](self, node)
 
     def generic_visit(self, node: NL) -> T:
         raise NotImplementedError(f"visit_{self.get_node_name(node)}")
@@ -62,39 +76,38 @@ class Visitor(Generic[T]):
         return result
 
 
-class LineRange(TypedDict):
-    lineno: int
-    col_offset: int
-    end_lineno: int
-    end_col_offset: int
-
-
 def get_line_range_for_leaf(leaf: Leaf) -> LineRange:
-    raw_text = leaf.value.encode("utf-8")
+    value = leaf.value
+    if "\n" not in value and value.isascii():
+        # fast path; offsets are in UTF-8 bytes, so this only holds for ASCII
+        return (leaf.lineno, leaf.column, leaf.lineno, leaf.column + len(value))
+    raw_text = value.encode("utf-8")
     num_newlines = raw_text.count(b"\n")
     if num_newlines == 0:
         end_col_offset = leaf.column + len(raw_text)
     else:
         end_col_offset = len(raw_text) - raw_text.rfind(b"\n") - 1
-    return LineRange(
-        lineno=leaf.lineno,
-        col_offset=leaf.column,
-        end_lineno=leaf.lineno + num_newlines,
-        end_col_offset=end_col_offset,
-    )
+    return (leaf.lineno, leaf.column, leaf.lineno + num_newlines, end_col_offset)
 
 
 def get_line_range(node: NL, *, ignore_last_leaf: bool = False) -> LineRange:
     if isinstance(node, Leaf):
         return get_line_range_for_leaf(node)
-    else:
-        begin_range = get_line_range(node.children[0])
-        last_child = node.children[-1]
-        if ignore_last_leaf and isinstance(last_child, Leaf):
-            end_range = get_line_range(node.children[-2])
-        else:
-            end_range = get_line_range(last_child, ignore_last_leaf=ignore_last_leaf)
-        return unify_line_ranges(begin_range, end_range)
+    # The range runs from the first to the last leaf; find them without recursion.
+    first = node
+    while not isinstance(first, Leaf):
+        first = first.children[0]
+    last = node
+    if ignore_last_leaf:
+        while not isinstance(last, Leaf):
+            if isinstance(last.children[-1], Leaf):
+                last = last.children[-2]
+                break
+            last = last.children[-1]
+    while not isinstance(last, Leaf):
+        last = last.children[-1]
+    end_range = get_line_range_for_leaf(last)
+    return (first.lineno, first.column, end_range[2], end_range[3])
 
 
 def _get_line_range_for_lvb(node: LVB) -> LineRange:
@@ -109,21 +122,11 @@ def _get_line_range_for_lvb(node: LVB) -> LineRange:
 def get_line_range_for_ast(node: Union[ast.expr, ast.stmt]) -> LineRange:
     assert node.end_lineno is not None
     assert node.end_col_offset is not None
-    return LineRange(
-        lineno=node.lineno,
-        col_offset=node.col_offset,
-        end_lineno=node.end_lineno,
-        end_col_offset=node.end_col_offset,
-    )
+    return (node.lineno, node.col_offset, node.end_lineno, node.end_col_offset)
 
 
 def unify_line_ranges(begin_range: LineRange, end_range: LineRange) -> LineRange:
-    return LineRange(
-        lineno=begin_range["lineno"],
-        col_offset=begin_range["col_offset"],
-        end_lineno=end_range["end_lineno"],
-        end_col_offset=end_range["end_col_offset"],
-    )
+    return (begin_range[0], begin_range[1], end_range[2], end_range[3])
 
 
 def literal_eval(s: str) -> object:
@@ -136,6 +139,63 @@ def literal_eval(s: str) -> object:
         return ast.literal_eval(tree)
 
 
+def _eval_number(s: str) -> object:
+    """Evaluate a NUMBER token without going through the parser."""
+    try:
+        if s[:2].lower() in ("0x", "0o", "0b"):
+            return int(s, 0)
+        elif s[-1] in "jJ":
+            return complex(s)
+        elif "." in s or "e" in s or "E" in s:
+            return float(s)
+        else:
+            return int(s, 0)
+    except ValueError:
+        # let the parser produce its usual error (e.g., for 0777)
+        return ast.literal_eval(s)
+
+
+_SIMPLE_STRING_PREFIXES = frozenset({"", "r", "u", "b", "br", "rb"})
+# Match every escape sequence in a string body, capturing the character after
+# the backslash only when the escape is invalid (including octal escapes above
+# \377). The parser warns about those and the codecs warn differently.
+_VALID_ESCAPES = r"""[\n\\'"abfnrtvx]|[0-3][0-7]{0,2}|[4-7][0-7]?(?![0-7])"""
+_STR_ESCAPE_RE = re.compile(rf"\\(?:{_VALID_ESCAPES}|[NuU]|(.))", re.DOTALL)
+_BYTES_ESCAPE_RE = re.compile(rf"\\(?:{_VALID_ESCAPES}|(.))", re.DOTALL)
+
+
+def _eval_string(s: str) -> Any:
+    """Evaluate a STRING token, avoiding the parser in the common cases."""
+    body = s.lstrip("rRbBuU")
+    prefix = s[: len(s) - len(body)].lower()
+    if prefix not in _SIMPLE_STRING_PREFIXES:
+        return ast.literal_eval(s)
+    if body[:3] in ('"""', "'''"):
+        body = body[3:-3]
+    elif body[:1] in ('"', "'"):
+        body = body[1:-1]
+    else:
+        return ast.literal_eval(s)
+    is_bytes = "b" in prefix
+    if "\r" in body or (is_bytes and not body.isascii()):
+        return ast.literal_eval(s)
+    if "r" in prefix or "\\" not in body:
+        return body.encode("ascii") if is_bytes else body
+    if not body.isascii():
+        return ast.literal_eval(s)
+    escape_re = _BYTES_ESCAPE_RE if is_bytes else _STR_ESCAPE_RE
+    if any(escape_re.findall(body)):
+        # let the parser produce its usual warning
+        return ast.literal_eval(s)
+    try:
+        if is_bytes:
+            return codecs.escape_decode(body.encode("ascii"))[0]
+        return body.encode("ascii").decode("unicode_escape")
+    except ValueError:
+        # let the parser produce its usual error
+        return ast.literal_eval(s)
+
+
 _ASTT = TypeVar("_ASTT", bound=ast.AST)
 
 
@@ -156,6 +216,20 @@ def change_type(
     return new_type(**new_kwargs)
 
 
+def make_node(
+    new_type: Callable[..., _ASTT], line_range: LineRange, /, **kwargs: Any
+) -> _ASTT:
+    """Construct an AST node located at the given line range."""
+    lineno, col_offset, end_lineno, end_col_offset = line_range
+    return new_type(
+        lineno=lineno,
+        col_offset=col_offset,
+        end_lineno=end_lineno,
+        end_col_offset=end_col_offset,
+        **kwargs,
+    )
+
+
 def empty_arguments() -> ast.arguments:
     return ast.arguments(
         posonlyargs=[],
@@ -226,13 +300,57 @@ TOKEN_TYPE_TO_AUGASSIGN = {
     token.CIRCUMFLEXEQUAL: ast.BitXor,
 }
 
+# Contexts and operators have no fields, so one shared instance of each is
+# enough (CPython's parser does the same).
+_LOAD = ast.Load()
+_STORE = ast.Store()
+_DEL = ast.Del()
+_NOT = ast.Not()
+_AND = ast.And()
+_OR = ast.Or()
+_POW = ast.Pow()
+_NOT_IN = ast.NotIn()
+_IS_NOT = ast.IsNot()
+_SHARED_OPERATORS: dict[type[ast.AST], Any] = {}
+
+
+def _shared_operator(op_type: type[_ASTT]) -> _ASTT:
+    """Return a shared instance of an operator class from the tables above.
+
+    The tables are looked up at call time, so that entries added to them by
+    custom grammars still take effect.
+    """
+    op = _SHARED_OPERATORS.get(op_type)
+    if op is None:
+        op = _SHARED_OPERATORS[op_type] = op_type()
+    return op
+
+
+# Tokens that can appear between statements but do not compile to anything.
+_STATEMENT_LIST_SEPARATORS = frozenset({token.NEWLINE, token.ENDMARKER})
+
 
-@dataclass
 class Consumer:
     """Parsing helper for parsing complicated CST nodes."""
 
-    children: Sequence[NL]
-    index: int = 0
+    __slots__ = ("children", "index")
+
+    def __init__(self, children: Sequence[NL], index: int = 0) -> None:
+        """Start consuming children at the given index."""
+        self.children = children
+        self.index = index
+
+    def __repr__(self) -> str:
+        """Show the children and the current index."""
+        return f"Consumer(children={self.children!r}, index={self.index!r})"
+
+    def __eq__(self, other: object) -> bool:
+        """Compare children and index."""
+        if not isinstance(other, Consumer) or other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.children, self.index) == (other.children, other.index)
+
+    __hash__ = None  # type: ignore[assignment]
 
     def consume(self, typ: Optional[int] = None) -> Optional[NL]:
         if self.index < len(self.children) and (
@@ -272,7 +390,7 @@ class Consumer:
 
 
 class Compiler(Visitor[ast.AST]):
-    expr_context: ast.expr_context = ast.Load()
+    expr_context: ast.expr_context = _LOAD
 
     if sys.version_info >= (3, 10):
         _match_compiler: Optional["MatchCompiler"] = None
@@ -299,7 +417,9 @@ class Compiler(Visitor[ast.AST]):
 
     if sys.version_info >= (3, 12):
 
-        def visit_typevar(self, node: Node) -> ast.AST:
+        def _compile_typevar_parts(
+            self, node: Node
+        ) -> tuple[str, Optional[ast.expr], Optional[ast.expr]]:
             consumer = Consumer(node.children)
             name = extract_name(consumer.expect(token.NAME))
             bound = None
@@ -308,48 +428,66 @@ class Compiler(Visitor[ast.AST]):
                 bound = self.visit_typed(consumer.expect(), ast.expr)
             if consumer.consume(token.EQUAL) is not None:
                 default = self.visit_typed(consumer.expect(), ast.expr)
-            if sys.version_info >= (3, 13):
-                return ast.TypeVar(
+            return name, bound, default
+
+        if sys.version_info >= (3, 13):
+
+            def visit_typevar(self, node: Node) -> ast.AST:
+                name, bound, default = self._compile_typevar_parts(node)
+                return make_node(
+                    ast.TypeVar,
+                    get_line_range(node),
                     name=name,
                     bound=bound,
                     default_value=default,
-                    **get_line_range(node),
                 )
-            else:
-                if default is not None and sys.version_info < (3, 13):
-                    raise UnsupportedSyntaxError("TypeVar default")
-                return ast.TypeVar(name=name, bound=bound, **get_line_range(node))
 
-        def visit_paramspec(self, node: Node) -> ast.AST:
-            if sys.version_info >= (3, 13):
+            def visit_paramspec(self, node: Node) -> ast.AST:
                 if len(node.children) == 4:
                     default_value = self.visit(node.children[3])
                 else:
                     default_value = None
-                return ast.ParamSpec(
+                return make_node(
+                    ast.ParamSpec,
+                    get_line_range(node),
                     name=node.children[1].value,
                     default_value=default_value,
-                    **get_line_range(node),
-                )
-            else:
-                return ast.ParamSpec(
-                    name=extract_name(node.children[1]), **get_line_range(node)
                 )
 
-        def visit_typevartuple(self, node: Node) -> ast.TypeVarTuple:
-            if sys.version_info >= (3, 13):
+            def visit_typevartuple(self, node: Node) -> ast.TypeVarTuple:
                 if len(node.children) == 4:
                     default_value = self.visit(node.children[3])
                 else:
                     default_value = None
-                return ast.TypeVarTuple(
+                return make_node(
+                    ast.TypeVarTuple,
+                    get_line_range(node),
                     name=node.children[1].value,
                     default_value=default_value,
-                    **get_line_range(node),
                 )
-            else:
-                return ast.TypeVarTuple(
-                    name=extract_name(node.children[1]), **get_line_range(node)
+
+        else:
+
+            def visit_typevar(self, node: Node) -> ast.AST:
+                name, bound, default = self._compile_typevar_parts(node)
+                if default is not None:
+                    raise UnsupportedSyntaxError("TypeVar default")
+                return make_node(
+                    ast.TypeVar, get_line_range(node), name=name, bound=bound
+                )
+
+            def visit_paramspec(self, node: Node) -> ast.AST:
+                return make_node(
+                    ast.ParamSpec,
+                    get_line_range(node),
+                    name=extract_name(node.children[1]),
+                )
+
+            def visit_typevartuple(self, node: Node) -> ast.TypeVarTuple:
+                return make_node(
+                    ast.TypeVarTuple,
+                    get_line_range(node),
+                    name=extract_name(node.children[1]),
                 )
 
         def _make_type_param(self, node: NL) -> ast.type_param:
@@ -357,13 +495,13 @@ class Compiler(Visitor[ast.AST]):
             if isinstance(result, ast.type_param):
                 return result
             elif isinstance(result, ast.Name):
-                return ast.TypeVar(name=result.id, **get_line_range(node))
+                return make_node(ast.TypeVar, get_line_range(node), name=result.id)
             else:
                 raise UnsupportedSyntaxError("Type parameter")
 
         def compile_typeparams(self, node: NL) -> list[ast.type_param]:
             if isinstance(node, Leaf):
-                return [ast.TypeVar(name=node.value, **get_line_range(node))]
+                return [make_node(ast.TypeVar, get_line_range(node), name=node.value)]
             return [self._make_type_param(child) for child in node.children[1:-1:2]]
 
     else:
@@ -373,10 +511,12 @@ class Compiler(Visitor[ast.AST]):
 
     def compile_statement_list(self, nodes: Sequence[NL]) -> list[ast.stmt]:
         statements = []
+        simple_stmt = self.syms.simple_stmt
         for node in nodes:
-            if node.type in (token.ENDMARKER, token.NEWLINE):
+            typ = node.type
+            if typ in _STATEMENT_LIST_SEPARATORS:
                 continue
-            if isinstance(node, Node) and node.type == self.syms.simple_stmt:
+            if typ == simple_stmt and isinstance(node, Node):
                 statements += self.compile_simple_stmt(node)
             else:
                 statements.append(self.visit_typed(node, ast.stmt))
@@ -393,7 +533,7 @@ class Compiler(Visitor[ast.AST]):
         for child in node.children[::2]:
             val = self.visit(child)
             if isinstance(val, ast.expr):
-                statements.append(ast.Expr(val, **get_line_range(child)))
+                statements.append(make_node(ast.Expr, get_line_range(child), value=val))
             else:
                 assert isinstance(val, ast.stmt)
                 statements.append(val)
@@ -402,7 +542,7 @@ class Compiler(Visitor[ast.AST]):
     def visit_expr_stmt(self, node: Node) -> ast.AST:
         consumer = Consumer(node.children)
         lhs_node = consumer.expect()
-        with self.set_expr_context(ast.Store()):
+        with self.set_expr_context(_STORE):
             lhs = self.visit_typed(lhs_node, ast.expr)
         if (annassign := consumer.consume(self.syms.annassign)) is not None:
             annotation = self.visit_typed(annassign.children[1], ast.expr)
@@ -413,12 +553,13 @@ class Compiler(Visitor[ast.AST]):
             simple = 1 if lhs_node.type == token.NAME else 0
             if not isinstance(lhs, (ast.Name, ast.Attribute, ast.Subscript)):
                 raise UnsupportedSyntaxError("AnnAssign target")
-            return ast.AnnAssign(
+            return make_node(
+                ast.AnnAssign,
+                get_line_range(node),
                 target=lhs,
                 annotation=annotation,
                 value=value,
                 simple=simple,
-                **get_line_range(node),
             )
         elif consumer.consume(token.EQUAL) is not None:
             exprs = []
@@ -426,7 +567,7 @@ class Compiler(Visitor[ast.AST]):
             while True:
                 child = consumer.expect()
                 if consumer.index < len(node.children):
-                    with self.set_expr_context(ast.Store()):
+                    with self.set_expr_context(_STORE):
                         exprs.append(self.visit_typed(child, ast.expr))
                 else:
                     rhs = self.visit_typed(child, ast.expr)
@@ -435,29 +576,32 @@ class Compiler(Visitor[ast.AST]):
                 else:
                     consumer.expect(token.EQUAL)
             assert rhs is not None
-            return ast.Assign(targets=[lhs, *exprs], value=rhs, **get_line_range(node))
+            return make_node(
+                ast.Assign, get_line_range(node), targets=[lhs, *exprs], value=rhs
+            )
         else:
             # AugAssign
             operator = consumer.expect()
             assert isinstance(operator, Leaf)
-            op = TOKEN_TYPE_TO_AUGASSIGN[operator.type]()
+            op = _shared_operator(TOKEN_TYPE_TO_AUGASSIGN[operator.type])
             if not isinstance(lhs, (ast.Name, ast.Attribute, ast.Subscript)):
                 raise UnsupportedSyntaxError("AugAssign target")
-            return ast.AugAssign(
+            return make_node(
+                ast.AugAssign,
+                get_line_range(node),
                 target=lhs,
                 op=op,
                 value=self.visit_typed(consumer.expect(), ast.expr),
-                **get_line_range(node),
             )
 
     def visit_del_stmt(self, node: Node) -> ast.AST:
-        with self.set_expr_context(ast.Del()):
+        with self.set_expr_context(_DEL):
             target = self.visit_typed(node.children[1], ast.expr)
         if isinstance(target, ast.Tuple) and node.children[1].type != self.syms.atom:
             targets = target.elts
         else:
             targets = [target]
-        return ast.Delete(targets=targets, **get_line_range(node))
+        return make_node(ast.Delete, get_line_range(node), targets=targets)
 
     def visit_raise_stmt(self, node: Node) -> ast.Raise:
         exc = self.visit_typed(node.children[1], ast.expr)
@@ -469,17 +613,18 @@ class Compiler(Visitor[ast.AST]):
             cause = self.visit_typed(node.children[3], ast.expr)
         else:
             cause = None
-        return ast.Raise(exc=exc, cause=cause, **get_line_range(node))
+        return make_node(ast.Raise, get_line_range(node), exc=exc, cause=cause)
 
     def visit_assert_stmt(self, node: Node) -> ast.Assert:
-        return ast.Assert(
+        return make_node(
+            ast.Assert,
+            get_line_range(node),
             test=self.visit_typed(node.children[1], ast.expr),
             msg=(
                 self.visit_typed(node.children[3], ast.expr)
                 if len(node.children) > 3
                 else None
             ),
-            **get_line_range(node),
         )
 
     def visit_global_stmt(self, node: Node) -> Union[ast.Global, ast.Nonlocal]:
@@ -489,18 +634,20 @@ class Compiler(Visitor[ast.AST]):
             names.append(name_node.value)
         assert isinstance(node.children[0], Leaf)
         if node.children[0].value == "global":
-            return ast.Global(names=names, **get_line_range(node))
+            return make_node(ast.Global, get_line_range(node), names=names)
         else:
-            return ast.Nonlocal(names=names, **get_line_range(node))
+            return make_node(ast.Nonlocal, get_line_range(node), names=names)
 
     def visit_return_stmt(self, node: Node) -> ast.AST:
-        return ast.Return(
-            value=self.visit_typed(node.children[1], ast.expr), **get_line_range(node)
+        return make_node(
+            ast.Return,
+            get_line_range(node),
+            value=self.visit_typed(node.children[1], ast.expr),
         )
 
     def visit_import_name(self, node: Node) -> ast.Import:
         aliases = self.compile_aliases(node.children[1])
-        return ast.Import(names=aliases, **get_line_range(node))
+        return make_node(ast.Import, get_line_range(node), names=aliases)
 
     def compile_aliases(self, node: NL) -> list[ast.alias]:
         aliases: list[ast.alias] = []
@@ -527,7 +674,9 @@ class Compiler(Visitor[ast.AST]):
                     name_pieces.append(c.value)
                 name = "".join(name_pieces)
 
-            aliases.append(ast.alias(name=name, asname=asname, **get_line_range(child)))
+            aliases.append(
+                make_node(ast.alias, get_line_range(child), name=name, asname=asname)
+            )
         return aliases
 
     def _resolve_dotted_name(self, node: NL) -> str:
@@ -553,19 +702,26 @@ class Compiler(Visitor[ast.AST]):
             module = self._resolve_dotted_name(name_node)
             consumer.expect_name("import")
         if (star := consumer.consume(token.STAR)) is not None:
-            aliases = [ast.alias(name="*", asname=None, **get_line_range(star))]
+            aliases = [
+                make_node(ast.alias, get_line_range(star), name="*", asname=None)
+            ]
         else:
             consumer.consume(token.LPAR)
             aliases = self.compile_aliases(consumer.expect())
-        return ast.ImportFrom(
-            module=module, names=aliases, level=level, **get_line_range(node)
+        return make_node(
+            ast.ImportFrom,
+            get_line_range(node),
+            module=module,
+            names=aliases,
+            level=level,
         )
 
     def visit_type_stmt(self, node: Node) -> ast.AST:
-        name = ast.Name(
+        name = make_node(
+            ast.Name,
+            get_line_range(node.children[1]),
             id=extract_name(node.children[1]),
-            ctx=ast.Store(),
-            **get_line_range(node.children[1]),
+            ctx=_STORE,
         )
         value = self.visit_typed(node.children[-1], ast.expr)
         if len(node.children) == 5:
@@ -573,8 +729,12 @@ class Compiler(Visitor[ast.AST]):
         else:
             type_params = []
         if sys.version_info >= (3, 12):
-            return ast.TypeAlias(
-                name=name, type_params=type_params, value=value, **get_line_range(node)
+            return make_node(
+                ast.TypeAlias,
+                get_line_range(node),
+                name=name,
+                type_params=type_params,
+                value=value,
             )
         else:
             raise UnsupportedSyntaxError("Type alias")
@@ -610,23 +770,25 @@ class Compiler(Visitor[ast.AST]):
         suite, end_line_range = self.consume_and_compile_suite(consumer)
         line_range = unify_line_ranges(get_line_range(node.children[0]), end_line_range)
         if sys.version_info >= (3, 12):
-            return ast.FunctionDef(
+            return make_node(
+                ast.FunctionDef,
+                line_range,
                 name=name,
                 args=args,
                 body=suite,
                 decorator_list=[],
                 returns=returns,
                 type_params=type_params,
-                **line_range,
             )
         else:
-            return ast.FunctionDef(
+            return make_node(
+                ast.FunctionDef,
+                line_range,
                 decorator_list=[],
                 name=name,
                 args=args,
                 body=suite,
                 returns=returns,
-                **line_range,
             )
 
     def visit_classdef(self, node: Node) -> ast.ClassDef:
@@ -647,23 +809,25 @@ class Compiler(Visitor[ast.AST]):
         suite, end_line_range = self.consume_and_compile_suite(consumer)
         line_range = unify_line_ranges(get_line_range(node.children[0]), end_line_range)
         if sys.version_info >= (3, 12):
-            return ast.ClassDef(
+            return make_node(
+                ast.ClassDef,
+                line_range,
                 name=name,
                 bases=bases,
                 keywords=keywords,
                 body=suite,
                 decorator_list=[],
                 type_params=type_params,
-                **line_range,
             )
         else:
-            return ast.ClassDef(
+            return make_node(
+                ast.ClassDef,
+                line_range,
                 name=name,
                 bases=bases,
                 keywords=keywords,
                 body=suite,
                 decorator_list=[],
-                **line_range,
             )
 
     def visit_if_stmt(self, node: Node) -> ast.If:
@@ -675,7 +839,7 @@ class Compiler(Visitor[ast.AST]):
         if maybe_line_range is not None:
             end_line_range = maybe_line_range
         line_range = unify_line_ranges(get_line_range(node.children[0]), end_line_range)
-        return ast.If(test=test, body=suite, orelse=orelse, **line_range)
+        return make_node(ast.If, line_range, test=test, body=suite, orelse=orelse)
 
     def _compile_if_recursive(
         self, consumer: Consumer
@@ -694,7 +858,7 @@ class Compiler(Visitor[ast.AST]):
                 end_line_range = maybe_line_range
             line_range = unify_line_ranges(get_line_range(keyword_node), end_line_range)
             return [
-                ast.If(test=test, body=suite, orelse=orelse, **line_range)
+                make_node(ast.If, line_range, test=test, body=suite, orelse=orelse)
             ], end_line_range
 
     if sys.version_info >= (3, 10):
@@ -707,7 +871,7 @@ class Compiler(Visitor[ast.AST]):
             line_range = unify_line_ranges(
                 get_line_range(node.children[0]), results[-1][1]
             )
-            return ast.Match(subject=subject, cases=cases, **line_range)
+            return make_node(ast.Match, line_range, subject=subject, cases=cases)
 
         def compile_case_block(self, node: NL) -> tuple[ast.match_case, LineRange]:
             consumer = Consumer(node.children)
@@ -735,12 +899,12 @@ class Compiler(Visitor[ast.AST]):
         else:
             orelse = []
         line_range = unify_line_ranges(get_line_range(node.children[0]), end_line_range)
-        return ast.While(test=test, body=body, orelse=orelse, **line_range)
+        return make_node(ast.While, line_range, test=test, body=body, orelse=orelse)
 
     def visit_for_stmt(self, node: Node) -> ast.For:
         consumer = Consumer(node.children)
         consumer.expect_name("for")
-        with self.set_expr_context(ast.Store()):
+        with self.set_expr_context(_STORE):
             target = self.visit_typed(consumer.expect(), ast.expr)
         consumer.expect_name("in")
         iter = self.visit_typed(consumer.expect(), ast.expr)
@@ -750,7 +914,9 @@ class Compiler(Visitor[ast.AST]):
         else:
             orelse = []
         line_range = unify_line_ranges(get_line_range(node.children[0]), end_line_range)
-        return ast.For(target=target, iter=iter, body=body, orelse=orelse, **line_range)
+        return make_node(
+            ast.For, line_range, target=target, iter=iter, body=body, orelse=orelse
+        )
 
     def visit_with_stmt(self, node: Node) -> ast.With:
         consumer = Consumer(node.children)
@@ -758,7 +924,7 @@ class Compiler(Visitor[ast.AST]):
         with_items = self._consume_with_items_list(consumer)
         suite, end_line_range = self.consume_and_compile_suite(consumer)
         line_range = unify_line_ranges(get_line_range(node.children[0]), end_line_range)
-        return ast.With(items=with_items, body=suite, **line_range)
+        return make_node(ast.With, line_range, items=with_items, body=suite)
 
     def _consume_with_items_list(self, consumer: Consumer) -> list[ast.withitem]:
         with_items = []
@@ -788,7 +954,7 @@ class Compiler(Visitor[ast.AST]):
                     context_expr = self.visit_typed(
                         with_item_node.children[0], ast.expr
                     )
-                    with self.set_expr_context(ast.Store()):
+                    with self.set_expr_context(_STORE):
                         optional_vars = self.visit_typed(
                             with_item_node.children[2], ast.expr
                         )
@@ -815,22 +981,22 @@ class Compiler(Visitor[ast.AST]):
             return change_type(
                 child,
                 ast.AsyncWith,
-                lineno=begin_line_range["lineno"],
-                col_offset=begin_line_range["col_offset"],
+                lineno=begin_line_range[0],
+                col_offset=begin_line_range[1],
             )
         elif isinstance(child, ast.For):
             return change_type(
                 child,
                 ast.AsyncFor,
-                lineno=begin_line_range["lineno"],
-                col_offset=begin_line_range["col_offset"],
+                lineno=begin_line_range[0],
+                col_offset=begin_line_range[1],
             )
         elif isinstance(child, ast.FunctionDef):
             return change_type(
                 child,
                 ast.AsyncFunctionDef,
-                lineno=begin_line_range["lineno"],
-                col_offset=begin_line_range["col_offset"],
+                lineno=begin_line_range[0],
+                col_offset=begin_line_range[1],
             )
         else:
             raise UnsupportedSyntaxError("async")
@@ -865,7 +1031,7 @@ class Compiler(Visitor[ast.AST]):
         else:
             typ = None
         if consumer.consume():  # "as" or comma
-            with self.set_expr_context(ast.Store()):
+            with self.set_expr_context(_STORE):
                 name_tree = self.visit_typed(consumer.expect(), ast.expr)
             if not isinstance(name_tree, ast.Name):
                 raise UnsupportedSyntaxError("ExceptHandler name")
@@ -876,7 +1042,7 @@ class Compiler(Visitor[ast.AST]):
         suite, end_line_range = self.consume_and_compile_suite(outer_consumer)
         line_range = unify_line_ranges(get_line_range(node.children[0]), end_line_range)
         return (
-            ast.ExceptHandler(type=typ, name=name, body=suite, **line_range),
+            make_node(ast.ExceptHandler, line_range, type=typ, name=name, body=suite),
             end_line_range,
             is_try_star,
         )
@@ -911,8 +1077,12 @@ class Compiler(Visitor[ast.AST]):
                         get_line_range(keyword), end_line_range
                     )
                     handlers.append(
-                        ast.ExceptHandler(
-                            type=None, name=None, body=suite, **line_range
+                        make_node(
+                            ast.ExceptHandler,
+                            line_range,
+                            type=None,
+                            name=None,
+                            body=suite,
                         )
                     )
                 else:
@@ -921,22 +1091,24 @@ class Compiler(Visitor[ast.AST]):
         line_range = unify_line_ranges(get_line_range(node.children[0]), end_line_range)
         if is_try_star:
             if sys.version_info >= (3, 11):
-                return ast.TryStar(
+                return make_node(
+                    ast.TryStar,
+                    line_range,
                     body=body,
                     handlers=handlers,
                     orelse=orelse,
                     finalbody=finalbody,
-                    **line_range,
                 )
             else:
                 raise UnsupportedSyntaxError("try star")
         else:
-            return ast.Try(
+            return make_node(
+                ast.Try,
+                line_range,
                 body=body,
                 handlers=handlers,
                 orelse=orelse,
                 finalbody=finalbody,
-                **line_range,
             )
 
     # Expressions
@@ -946,12 +1118,12 @@ class Compiler(Visitor[ast.AST]):
         if node.children[1].type == self.syms.old_comp_for:
             elt = self.visit_typed(node.children[0], ast.expr)
             comps = self._compile_comprehension(node.children[1])
-            return ast.GeneratorExp(
-                elt=elt, generators=comps, **get_line_range(parent_node)
+            return make_node(
+                ast.GeneratorExp, get_line_range(parent_node), elt=elt, generators=comps
             )
         elts = [self.visit_typed(child, ast.expr) for child in node.children[::2]]
-        return ast.Tuple(
-            elts=elts, ctx=self.expr_context, **get_line_range(parent_node)
+        return make_node(
+            ast.Tuple, get_line_range(parent_node), elts=elts, ctx=self.expr_context
         )
 
     visit_testlist_star_expr = visit_testlist_gexp = visit_subject_expr = visit_exprlist
@@ -959,7 +1131,9 @@ class Compiler(Visitor[ast.AST]):
     def visit_atom(self, node: Node) -> ast.AST:
         if node.children[0].type == token.LPAR:
             if len(node.children) == 2:
-                return ast.Tuple(elts=[], ctx=self.expr_context, **get_line_range(node))
+                return make_node(
+                    ast.Tuple, get_line_range(node), elts=[], ctx=self.expr_context
+                )
             # tuples, parenthesized expressions
             middle = node.children[1]
             if isinstance(middle, Node) and middle.type == self.syms.testlist_gexp:
@@ -967,108 +1141,140 @@ class Compiler(Visitor[ast.AST]):
             return self.visit(middle)
         elif node.children[0].type == token.LSQB:
             if len(node.children) == 2:
-                return ast.List(elts=[], ctx=self.expr_context, **get_line_range(node))
+                return make_node(
+                    ast.List, get_line_range(node), elts=[], ctx=self.expr_context
+                )
             # lists
             inner = node.children[1]
             if inner.type != self.syms.listmaker:
-                return ast.List(
+                return make_node(
+                    ast.List,
+                    get_line_range(node),
                     elts=[self.visit_typed(inner, ast.expr)],
                     ctx=self.expr_context,
-                    **get_line_range(node),
                 )
             if inner.children[1].type == self.syms.old_comp_for:
                 elt = self.visit_typed(inner.children[0], ast.expr)
                 comps = self._compile_comprehension(inner.children[1])
-                return ast.ListComp(elt=elt, generators=comps, **get_line_range(node))
+                return make_node(
+                    ast.ListComp, get_line_range(node), elt=elt, generators=comps
+                )
             elts = [self.visit_typed(child, ast.expr) for child in inner.children[::2]]
-            return ast.List(elts=elts, ctx=self.expr_context, **get_line_range(node))
+            return make_node(
+                ast.List, get_line_range(node), elts=elts, ctx=self.expr_context
+            )
         elif node.children[0].type == token.LBRACE:
             if len(node.children) == 2:
-                return ast.Dict(keys=[], values=[], **get_line_range(node))
+                return make_node(ast.Dict, get_line_range(node), keys=[], values=[])
             # sets, dicts
             inner = node.children[1]
             if inner.type != self.syms.dictsetmaker:
-                return ast.Set(
-                    elts=[self.visit_typed(inner, ast.expr)], **get_line_range(node)
+                return make_node(
+                    ast.Set,
+                    get_line_range(node),
+                    elts=[self.visit_typed(inner, ast.expr)],
                 )
-            consumer = Consumer(inner.children)
+            # hot path: walk the children with a local index instead of a Consumer
+            children = inner.children
+            num_children = len(children)
+            index = 0
             is_dict = False
             keys: list[Optional[ast.expr]] = []
             values = []
             elts = []
-            while not consumer.done():
-                if consumer.consume(token.DOUBLESTAR) is not None:
+            while index < num_children:
+                child = children[index]
+                index += 1
+                if child.type == token.DOUBLESTAR:
                     is_dict = True
-                    expr = consumer.expect()
                     keys.append(None)
-                    values.append(self.visit_typed(expr, ast.expr))
-                elif star_expr := consumer.consume(self.syms.star_expr):
+                    values.append(self.visit_typed(children[index], ast.expr))
+                    index += 1
+                elif child.type == self.syms.star_expr:
                     elts.append(
-                        ast.Starred(
-                            value=self.visit_typed(star_expr.children[1], ast.expr),
+                        make_node(
+                            ast.Starred,
+                            get_line_range(child),
+                            value=self.visit_typed(child.children[1], ast.expr),
                             ctx=self.expr_context,
-                            **get_line_range(star_expr),
                         )
                     )
                 else:
-                    key_node = consumer.expect()
-                    if (walrus := consumer.consume(token.COLONEQUAL)) is not None:
-                        value_node = consumer.expect()
-                        elt = self._compile_named_expr((key_node, walrus, value_node))
+                    next_type = children[index].type if index < num_children else None
+                    if next_type == token.COLONEQUAL:
+                        elt = self._compile_named_expr(
+                            (child, children[index], children[index + 1])
+                        )
                         elts.append(elt)
-                    elif consumer.consume(token.COLON) is not None:
-                        key = self.visit_typed(key_node, ast.expr)
-                        value = self.visit_typed(consumer.expect(), ast.expr)
+                        index += 2
+                    elif next_type == token.COLON:
+                        key = self.visit_typed(child, ast.expr)
+                        value = self.visit_typed(children[index + 1], ast.expr)
                         keys.append(key)
                         values.append(value)
                         is_dict = True
+                        index += 2
                     else:
-                        elts.append(self.visit_typed(key_node, ast.expr))
-                    if comp_for := consumer.consume(self.syms.comp_for):
-                        comps = self._compile_comprehension(comp_for)
+                        elts.append(self.visit_typed(child, ast.expr))
+                    if (
+                        index < num_children
+                        and children[index].type == self.syms.comp_for
+                    ):
+                        comps = self._compile_comprehension(children[index])
                         if is_dict:
                             assert len(keys) == 1 and keys[0] is not None, keys
                             assert len(values) == 1, values
                             assert not elts, elts
-                            return ast.DictComp(
+                            return make_node(
+                                ast.DictComp,
+                                get_line_range(node),
                                 key=keys[0],
                                 value=values[0],
                                 generators=comps,
-                                **get_line_range(node),
                             )
                         else:
                             assert len(elts) == 1, elts
                             assert not keys, keys
                             assert not values, values
-                            return ast.SetComp(
-                                elt=elts[0], generators=comps, **get_line_range(node)
+                            return make_node(
+                                ast.SetComp,
+                                get_line_range(node),
+                                elt=elts[0],
+                                generators=comps,
                             )
-                if not consumer.done():
-                    comma = consumer.consume(token.COMMA)
-                    assert comma is not None
+                if index < num_children:
+                    assert children[index].type == token.COMMA
+                    index += 1
             if is_dict:
                 assert not elts, elts
-                return ast.Dict(keys=keys, values=values, **get_line_range(node))
+                return make_node(
+                    ast.Dict, get_line_range(node), keys=keys, values=values
+                )
             else:
                 assert not keys, keys
                 assert not values, values
-                return ast.Set(elts=elts, **get_line_range(node))
+                return make_node(ast.Set, get_line_range(node), elts=elts)
         elif node.children[0].type == token.DOT:
             # ellipsis
             assert len(node.children) == 3
             assert all(child.type == token.DOT for child in node.children)
-            return ast.Constant(value=Ellipsis, **get_line_range(node))
+            return make_node(ast.Constant, get_line_range(node), value=Ellipsis)
         elif node.children[0].type == token.BACKQUOTE:
             # repr. Why not support it?
             line_range = get_line_range(node)
             inner = self.visit_typed(node.children[1], ast.expr)
-            return ast.JoinedStr(
+            return make_node(
+                ast.JoinedStr,
+                line_range,
                 values=[
-                    ast.FormattedValue(
-                        value=inner, conversion=ord("r"), format_spec=None, **line_range
+                    make_node(
+                        ast.FormattedValue,
+                        line_range,
+                        value=inner,
+                        conversion=ord("r"),
+                        format_spec=None,
                     )
                 ],
-                **line_range,
             )
         else:
             # concatenated strings
@@ -1095,44 +1301,49 @@ class Compiler(Visitor[ast.AST]):
                     bits = []
                     for leaf in last_value_bits:
                         assert isinstance(leaf, Leaf)
-                        bits.append(ast.literal_eval(leaf.value))
-                    return ast.Constant(value=b"".join(bits), **get_line_range(node))
+                        bits.append(_eval_string(leaf.value))
+                    return make_node(
+                        ast.Constant, get_line_range(node), value=b"".join(bits)
+                    )
                 values.append(self._concatenate_joined_strings(last_value_bits))
             if len(values) == 1 and not contains_fstring:
                 return values[0]
             return self._derange(
-                ast.JoinedStr(values=values, **get_line_range(node)), node
+                make_node(ast.JoinedStr, get_line_range(node), values=values), node
             )
 
     def visit_fstring(self, node: Node) -> ast.expr:
         values, last_value_bits = self._compile_fstring_innards(node.children, [], None)
         if last_value_bits:
             values.append(self._concatenate_joined_strings(last_value_bits))
-        joined = ast.JoinedStr(values=values, **get_line_range(node))
+        joined = make_node(ast.JoinedStr, get_line_range(node), values=values)
         return self._derange(joined, node)
 
     def _derange(self, value: ast.expr, node: Node) -> ast.expr:
         if sys.version_info >= (3, 12):
             return value
         if isinstance(value, ast.Constant):
-            return ast.Constant(
-                value=value.value, kind=value.kind, **get_line_range(node)
+            return make_node(
+                ast.Constant, get_line_range(node), value=value.value, kind=value.kind
             )
         elif isinstance(value, ast.FormattedValue):
+            format_spec: Optional[ast.expr]
             if isinstance(value.format_spec, ast.JoinedStr):
                 format_spec = self._derange(value.format_spec, node)
             else:
                 format_spec = value.format_spec
-            return ast.FormattedValue(
+            return make_node(
+                ast.FormattedValue,
+                get_line_range(node),
                 value=value.value,
                 conversion=value.conversion,
                 format_spec=format_spec,
-                **get_line_range(node),
             )
         elif isinstance(value, ast.JoinedStr):
-            return ast.JoinedStr(
+            return make_node(
+                ast.JoinedStr,
+                get_line_range(node),
                 values=[self._derange(val, node) for val in value.values],
-                **get_line_range(node),
             )
         else:
             return value
@@ -1187,14 +1398,14 @@ class Compiler(Visitor[ast.AST]):
             if next_node.prefix:
                 text += next_node.prefix
                 raw_prefix = next_node.prefix.encode("utf-8")
-                line_range["end_lineno"] += raw_prefix.count(b"\n")
+                lineno, col_offset, end_lineno, end_col_offset = line_range
+                end_lineno += raw_prefix.count(b"\n")
                 if b"\n" in raw_prefix:
-                    line_range["end_col_offset"] = (
-                        len(raw_prefix) - raw_prefix.rfind(b"\n") - 1
-                    )
+                    end_col_offset = len(raw_prefix) - raw_prefix.rfind(b"\n") - 1
                 else:
-                    line_range["end_col_offset"] += len(raw_prefix)
-            self_doc = ast.Constant(value=text, **line_range)
+                    end_col_offset += len(raw_prefix)
+                line_range = (lineno, col_offset, end_lineno, end_col_offset)
+            self_doc = make_node(ast.Constant, line_range, value=text)
         if consumer.consume(token.BANG) is not None:
             specifier = consumer.expect(token.NAME)
             assert isinstance(specifier, Leaf)
@@ -1213,25 +1424,26 @@ class Compiler(Visitor[ast.AST]):
                 # there's always an empty Constant for some reason
                 prev_line_range = get_line_range(node.children[-2])
                 next_line_range = get_line_range(node.children[-1])
-                line_range = LineRange(
-                    lineno=prev_line_range["end_lineno"],
-                    col_offset=prev_line_range["end_col_offset"],
-                    end_lineno=next_line_range["lineno"],
-                    end_col_offset=next_line_range["col_offset"],
+                line_range = (
+                    prev_line_range[2],
+                    prev_line_range[3],
+                    next_line_range[0],
+                    next_line_range[1],
                 )
-                values.append(ast.Constant(value="", **line_range))
+                values.append(make_node(ast.Constant, line_range, value=""))
             line_range = unify_line_ranges(
                 get_line_range(colon), get_line_range(node.children[-2])
             )
-            format_spec = ast.JoinedStr(values=values, **line_range)
+            format_spec = make_node(ast.JoinedStr, line_range, values=values)
         if conversion == -1 and format_spec is None and self_doc is not None:
             conversion = ord("r")
 
-        return self_doc, ast.FormattedValue(
+        return self_doc, make_node(
+            ast.FormattedValue,
+            get_line_range(node),
             value=expr,
             conversion=conversion,
             format_spec=format_spec,
-            **get_line_range(node),
         )
 
     def _concatenate_joined_strings(self, nodes: Sequence[LVB]) -> ast.Constant:
@@ -1250,25 +1462,32 @@ class Compiler(Visitor[ast.AST]):
                     prefix = _string_prefix(node)
                     if "u" in prefix:
                         kind = "u"
-                strings.append(ast.literal_eval(node.value))
+                strings.append(_eval_string(node.value))
             else:
                 raise RuntimeError(f"Unexpected node: {node!r}")
         line_range = unify_line_ranges(
             _get_line_range_for_lvb(nodes[0]), _get_line_range_for_lvb(nodes[-1])
         )
-        return ast.Constant(value="".join(strings), kind=kind, **line_range)
+        return make_node(ast.Constant, line_range, value="".join(strings), kind=kind)
 
     def visit_expr(self, node: Node) -> ast.expr:
-        op = self.visit_typed(node.children[0], ast.expr)
-        begin_range = get_line_range(node.children[0])
-        for child_index in range(2, len(node.children), 2):
-            child = node.children[child_index]
-            operator = node.children[child_index - 1]
+        children = node.children
+        op = self.visit_typed(children[0], ast.expr)
+        lineno, col_offset, _, _ = get_line_range(children[0])
+        # each BinOp spans from the first operand to the end of the current one
+        for child_index in range(2, len(children), 2):
+            child = children[child_index]
+            end_range = get_line_range(child)
             op = ast.BinOp(
                 left=op,
-                op=TOKEN_TYPE_TO_BINOP[operator.type](),
+                op=_shared_operator(
+                    TOKEN_TYPE_TO_BINOP[children[child_index - 1].type]
+                ),
                 right=self.visit_typed(child, ast.expr),
-                **unify_line_ranges(begin_range, get_line_range(child)),
+                lineno=lineno,
+                col_offset=col_offset,
+                end_lineno=end_range[2],
+                end_col_offset=end_range[3],
             )
         return op
 
@@ -1285,78 +1504,90 @@ class Compiler(Visitor[ast.AST]):
             operator_node = node.children[child_index - 1]
             if isinstance(operator_node, Leaf):
                 if operator_node.type == token.NAME:
-                    operator = NAME_TO_COMPARE_OP[operator_node.value]()
+                    op_type = NAME_TO_COMPARE_OP[operator_node.value]
                 else:
-                    operator = TOKEN_TYPE_TO_COMPARE_OP[operator_node.type]()
+                    op_type = TOKEN_TYPE_TO_COMPARE_OP[operator_node.type]
+                ops.append(_shared_operator(op_type))
             else:
-                # is not, not in
-                first, second = operator_node.children
-                assert isinstance(first, Leaf) and first.type == token.NAME
-                assert isinstance(second, Leaf) and second.type == token.NAME
-                if first.value == "not":
-                    assert second.value == "in"
-                    operator = ast.NotIn()
-                else:
-                    assert first.value == "is"
-                    assert second.value == "not"
-                    operator = ast.IsNot()
-            ops.append(operator)
+                ops.append(self._compile_two_token_comparison_op(operator_node))
             right = self.visit_typed(child, ast.expr)
             comparators.append(right)
-        return ast.Compare(
-            left=left, ops=ops, comparators=comparators, **get_line_range(node)
+        return make_node(
+            ast.Compare,
+            get_line_range(node),
+            left=left,
+            ops=ops,
+            comparators=comparators,
         )
 
+    def _compile_two_token_comparison_op(self, node: Node) -> ast.cmpop:
+        # is not, not in
+        first, second = node.children
+        assert isinstance(first, Leaf) and first.type == token.NAME
+        assert isinstance(second, Leaf) and second.type == token.NAME
+        if first.value == "not":
+            assert second.value == "in"
+            return _NOT_IN
+        else:
+            assert first.value == "is"
+            assert second.value == "not"
+            return _IS_NOT
+
     def visit_star_expr(self, node: Node) -> ast.AST:
-        return ast.Starred(
+        return make_node(
+            ast.Starred,
+            get_line_range(node),
             value=self.visit_typed(node.children[1], ast.expr),
             ctx=self.expr_context,
-            **get_line_range(node),
         )
 
     def visit_not_test(self, node: Node) -> ast.AST:
-        return ast.UnaryOp(
-            op=ast.Not(),
+        return make_node(
+            ast.UnaryOp,
+            get_line_range(node),
+            op=_NOT,
             operand=self.visit_typed(node.children[1], ast.expr),
-            **get_line_range(node),
         )
 
     def visit_and_test(self, node: Node) -> ast.AST:
         operands = [self.visit_typed(child, ast.expr) for child in node.children[::2]]
-        return ast.BoolOp(op=ast.And(), values=operands, **get_line_range(node))
+        return make_node(ast.BoolOp, get_line_range(node), op=_AND, values=operands)
 
     def visit_or_test(self, node: Node) -> ast.AST:
         operands = [self.visit_typed(child, ast.expr) for child in node.children[::2]]
-        return ast.BoolOp(op=ast.Or(), values=operands, **get_line_range(node))
+        return make_node(ast.BoolOp, get_line_range(node), op=_OR, values=operands)
 
     def visit_test(self, node: Node) -> ast.AST:
         # must be if-else
         assert len(node.children) == 5
         assert isinstance(node.children[1], Leaf) and node.children[1].value == "if"
         assert isinstance(node.children[3], Leaf) and node.children[3].value == "else"
-        return ast.IfExp(
+        return make_node(
+            ast.IfExp,
+            get_line_range(node),
             test=self.visit_typed(node.children[2], ast.expr),
             body=self.visit_typed(node.children[0], ast.expr),
             orelse=self.visit_typed(node.children[4], ast.expr),
-            **get_line_range(node),
         )
 
     def visit_factor(self, node: Node) -> ast.UnaryOp:
-        return ast.UnaryOp(
-            op=TOKEN_TYPE_TO_UNARY_OP[node.children[0].type](),
+        return make_node(
+            ast.UnaryOp,
+            get_line_range(node),
+            op=_shared_operator(TOKEN_TYPE_TO_UNARY_OP[node.children[0].type]),
             operand=self.visit_typed(node.children[1], ast.expr),
-            **get_line_range(node),
         )
 
     def visit_power(self, node: Node) -> ast.expr:
         children = node.children
         if len(children) > 2 and node.children[-2].type == token.DOUBLESTAR:
             operand = self.visit_typed(children[-1], ast.expr)
-            return ast.BinOp(
+            return make_node(
+                ast.BinOp,
+                get_line_range(node),
                 left=self._visit_power_without_power(children[:-2]),
-                op=ast.Pow(),
+                op=_POW,
                 right=operand,
-                **get_line_range(node),
             )
         else:
             return self._visit_power_without_power(children)
@@ -1366,65 +1597,70 @@ class Compiler(Visitor[ast.AST]):
             line_range = unify_line_ranges(
                 get_line_range(children[0]), get_line_range(children[-1])
             )
-            return ast.Await(
-                value=self.compile_power_without_await(children[1:]), **line_range
+            return make_node(
+                ast.Await,
+                line_range,
+                value=self.compile_power_without_await(children[1:]),
             )
         else:
             return self.compile_power_without_await(children)
 
     def compile_power_without_await(self, children: Sequence[NL]) -> ast.expr:
+        if len(children) == 1:
+            return self.visit_typed(children[0], ast.expr)
         trailers = children[1:]
-        if trailers:
-            with self.set_expr_context(ast.Load()):
-                atom = self.visit_typed(children[0], ast.expr)
-        else:
+        last_trailer = trailers[-1]
+        with self.set_expr_context(_LOAD):
             atom = self.visit_typed(children[0], ast.expr)
         begin_range = get_line_range(children[0])
         for trailer in trailers:
             assert isinstance(trailer, Node)
-            if trailer is trailers[-1]:
+            if trailer is last_trailer:
                 ctx = self.expr_context
             else:
-                ctx = ast.Load()
+                ctx = _LOAD
             if trailer.children[0].type == token.LPAR:  # call
                 if len(trailer.children) == 2:
                     args: list[ast.expr] = []
                     keywords: list[ast.keyword] = []
                 else:
                     args, keywords = self._compile_arglist(trailer.children[1], trailer)
-                atom = ast.Call(
+                atom = make_node(
+                    ast.Call,
+                    unify_line_ranges(
+                        begin_range, get_line_range(trailer.children[-1])
+                    ),
                     func=atom,
                     args=args,
                     keywords=keywords,
-                    **unify_line_ranges(
-                        begin_range, get_line_range(trailer.children[-1])
-                    ),
                 )
             elif trailer.children[0].type == token.LSQB:  # subscript
                 line_range = unify_line_ranges(
                     begin_range, get_line_range(trailer.children[-1])
                 )
-                with self.set_expr_context(ast.Load()):
+                with self.set_expr_context(_LOAD):
                     subscript = self.visit_typed(trailer.children[1], ast.expr)
                 if isinstance(subscript, ast.Starred):
-                    subscript = ast.Tuple(
+                    subscript = make_node(
+                        ast.Tuple,
+                        get_line_range(trailer.children[1]),
                         elts=[subscript],
-                        ctx=ast.Load(),
-                        **get_line_range(trailer.children[1]),
+                        ctx=_LOAD,
                     )
-                atom = ast.Subscript(value=atom, slice=subscript, ctx=ctx, **line_range)
+                atom = make_node(
+                    ast.Subscript, line_range, value=atom, slice=subscript, ctx=ctx
+                )
             elif trailer.children[0].type == token.DOT:  # attribute
                 assert (
                     isinstance(trailer.children[1], Leaf)
                     and trailer.children[1].type == token.NAME
                 )
-                atom = ast.Attribute(
+                atom = make_node(
+                    ast.Attribute,
+                    unify_line_ranges(begin_range, get_line_range(trailer.children[1])),
                     value=atom,
                     attr=trailer.children[1].value,
                     ctx=ctx,
-                    **unify_line_ranges(
-                        begin_range, get_line_range(trailer.children[1])
-                    ),
                 )
             else:
                 raise NotImplementedError(repr(trailer))
@@ -1444,26 +1680,31 @@ class Compiler(Visitor[ast.AST]):
                 args.append(self.visit_typed(argument, ast.expr))
             elif argument.children[0].type == token.STAR:
                 args.append(
-                    ast.Starred(
+                    make_node(
+                        ast.Starred,
+                        get_line_range(argument),
                         value=self.visit_typed(argument.children[1], ast.expr),
-                        ctx=ast.Load(),
-                        **get_line_range(argument),
+                        ctx=_LOAD,
                     )
                 )
             elif argument.children[0].type == token.DOUBLESTAR:
                 keywords.append(
-                    ast.keyword(
+                    make_node(
+                        ast.keyword,
+                        get_line_range(argument),
                         arg=None,
                         value=self.visit_typed(argument.children[1], ast.expr),
-                        **get_line_range(argument),
                     )
                 )
             elif len(argument.children) == 2:
                 inner = self.visit_typed(argument.children[0], ast.expr)
                 comps = self._compile_comprehension(argument.children[1])
                 args.append(
-                    ast.GeneratorExp(
-                        elt=inner, generators=comps, **get_line_range(parent_node)
+                    make_node(
+                        ast.GeneratorExp,
+                        get_line_range(parent_node),
+                        elt=inner,
+                        generators=comps,
                     )
                 )
             elif argument.children[1].type == token.COLONEQUAL:
@@ -1471,14 +1712,17 @@ class Compiler(Visitor[ast.AST]):
                 if len(argument.children) > 3:
                     comps = self._compile_comprehension(node.children[3])
                     args.append(
-                        ast.GeneratorExp(
-                            elt=walrus, generators=comps, **get_line_range(parent_node)
+                        make_node(
+                            ast.GeneratorExp,
+                            get_line_range(parent_node),
+                            elt=walrus,
+                            generators=comps,
                         )
                     )
                 else:
                     args.append(walrus)
             elif argument.children[1].type == token.EQUAL:
-                with self.set_expr_context(ast.Store()):
+                with self.set_expr_context(_STORE):
                     target = self.visit(argument.children[0])
                 if not isinstance(target, ast.Name):
                     raise UnsupportedSyntaxError(
@@ -1486,7 +1730,12 @@ class Compiler(Visitor[ast.AST]):
                     )
                 value = self.visit_typed(argument.children[2], ast.expr)
                 keywords.append(
-                    ast.keyword(arg=target.id, value=value, **get_line_range(argument))
+                    make_node(
+                        ast.keyword,
+                        get_line_range(argument),
+                        arg=target.id,
+                        value=value,
+                    )
                 )
             else:
                 raise NotImplementedError(repr(argument))
@@ -1506,7 +1755,7 @@ class Compiler(Visitor[ast.AST]):
         else:
             ifs = []
             comps = []
-        with self.set_expr_context(ast.Store()):
+        with self.set_expr_context(_STORE):
             target = self.visit_typed(children[1], ast.expr)
         comp = ast.comprehension(
             target=target,
@@ -1534,50 +1783,58 @@ class Compiler(Visitor[ast.AST]):
             return [], self._compile_comprehension(node)
 
     def _compile_named_expr(self, children: Sequence[NL]) -> ast.NamedExpr:
-        with self.set_expr_context(ast.Store()):
+        with self.set_expr_context(_STORE):
             target = self.visit(children[0])
         if not isinstance(target, ast.Name):
             raise UnsupportedSyntaxError("walrus target must be a name")
         value = self.visit_typed(children[2], ast.expr)
-        return ast.NamedExpr(
+        return make_node(
+            ast.NamedExpr,
+            unify_line_ranges(get_line_range(children[0]), get_line_range(children[2])),
             target=target,
             value=value,
-            **unify_line_ranges(
-                get_line_range(children[0]), get_line_range(children[2])
-            ),
         )
 
     def visit_namedexpr_test(self, node: Node) -> ast.NamedExpr:
         return self._compile_named_expr(node.children)
 
     def visit_subscript(self, node: Node) -> Union[ast.expr, ast.Slice]:
-        consumer = Consumer(node.children)
-        if consumer.consume(token.COLON) is None:
-            lower = self.visit_typed(consumer.expect(), ast.expr)
-            if consumer.consume(token.COLONEQUAL) is not None:
-                return self._compile_named_expr(node.children)
-            assert consumer.consume(token.COLON) is not None
+        children = node.children
+        num_children = len(children)
+        if children[0].type != token.COLON:
+            lower = self.visit_typed(children[0], ast.expr)
+            if children[1].type == token.COLONEQUAL:
+                return self._compile_named_expr(children)
+            assert children[1].type == token.COLON
+            index = 2
         else:
             lower = None
-        if (sliceop := consumer.consume(self.syms.sliceop)) is not None:
-            step = self.visit_typed(sliceop.children[1], ast.expr)
+            index = 1
+        next_type = children[index].type if index < num_children else None
+        if next_type == self.syms.sliceop:
+            step = self.visit_typed(children[index].children[1], ast.expr)
             upper = None
-        elif consumer.consume(token.COLON) is None:
-            if (upper_node := consumer.consume()) is None:
+        elif next_type == token.COLON:
+            upper = step = None
+        else:
+            if next_type is None:
                 upper = None
             else:
-                upper = self.visit_typed(upper_node, ast.expr)
-            if (sliceop := consumer.consume(self.syms.sliceop)) is not None:
-                step = self.visit_typed(sliceop.children[1], ast.expr)
+                upper = self.visit_typed(children[index], ast.expr)
+                index += 1
+            if index < num_children and children[index].type == self.syms.sliceop:
+                step = self.visit_typed(children[index].children[1], ast.expr)
             else:
                 step = None
-        else:
-            upper = step = None
-        return ast.Slice(lower=lower, upper=upper, step=step, **get_line_range(node))
+        return make_node(
+            ast.Slice, get_line_range(node), lower=lower, upper=upper, step=step
+        )
 
     def visit_subscriptlist(self, node: Node) -> ast.Tuple:
         elts = [self.visit_typed(child, ast.expr) for child in node.children[::2]]
-        return ast.Tuple(elts=elts, ctx=self.expr_context, **get_line_range(node))
+        return make_node(
+            ast.Tuple, get_line_range(node), elts=elts, ctx=self.expr_context
+        )
 
     def visit_lambdef(self, node: Node) -> ast.Lambda:
         maybe_args = node.children[1]
@@ -1586,7 +1843,7 @@ class Compiler(Visitor[ast.AST]):
         else:
             args = self.compile_args(maybe_args)
         body = self.visit_typed(node.children[-1], ast.expr)
-        return ast.Lambda(args=args, body=body, **get_line_range(node))
+        return make_node(ast.Lambda, get_line_range(node), args=args, body=body)
 
     def visit_parameters(self, node: Node) -> ast.arguments:
         if len(node.children) == 2:
@@ -1603,10 +1860,10 @@ class Compiler(Visitor[ast.AST]):
             children = node.children
         posonlyargs: list[ast.arg] = []
         args: list[ast.arg] = []
-        vararg = None
+        vararg: Optional[ast.arg] = None
         kwonlyargs: list[ast.arg] = []
         kw_defaults: list[Optional[ast.expr]] = []
-        kwarg = None
+        kwarg: Optional[ast.arg] = None
         defaults: list[ast.expr] = []
         current_args = args
 
@@ -1617,11 +1874,12 @@ class Compiler(Visitor[ast.AST]):
                 break
             if isinstance(tok, Leaf) and tok.type == token.NAME:
                 current_args.append(
-                    ast.arg(
+                    make_node(
+                        ast.arg,
+                        get_line_range(tok),
                         arg=tok.value,
                         annotation=None,
                         type_comment=None,
-                        **get_line_range(tok),
                     )
                 )
                 if consumer.consume(token.EQUAL) is not None:
@@ -1639,11 +1897,12 @@ class Compiler(Visitor[ast.AST]):
                 arg_name = extract_name(tok.children[0])
                 annotation = self.visit_typed(tok.children[2], ast.expr)
                 current_args.append(
-                    ast.arg(
+                    make_node(
+                        ast.arg,
+                        get_line_range(tok),
                         arg=arg_name,
                         annotation=annotation,
                         type_comment=None,
-                        **get_line_range(tok),
                     )
                 )
                 if consumer.consume(token.EQUAL) is not None:
@@ -1669,11 +1928,12 @@ class Compiler(Visitor[ast.AST]):
                     assert isinstance(args_node.children[0], Leaf)
                     name = args_node.children[0].value
                     annotation = self.visit_typed(args_node.children[2], ast.expr)
-                kwarg = ast.arg(
+                kwarg = make_node(
+                    ast.arg,
+                    get_line_range(args_node),
                     arg=name,
                     annotation=annotation,
                     type_comment=None,
-                    **get_line_range(args_node),
                 )
             elif tok.type == token.STAR:
                 if node.children[consumer.index].type == token.COMMA:
@@ -1692,11 +1952,12 @@ class Compiler(Visitor[ast.AST]):
                         assert isinstance(args_node.children[0], Leaf)
                         name = args_node.children[0].value
                         annotation = self.visit_typed(args_node.children[2], ast.expr)
-                    vararg = ast.arg(
+                    vararg = make_node(
+                        ast.arg,
+                        get_line_range(args_node),
                         arg=name,
                         annotation=annotation,
                         type_comment=None,
-                        **get_line_range(args_node),
                     )
                 current_args = kwonlyargs
             else:
@@ -1716,49 +1977,59 @@ class Compiler(Visitor[ast.AST]):
 
     def visit_yield_expr(self, node: Node) -> Union[ast.Yield, ast.YieldFrom]:
         if node.children[1].type == self.syms.yield_arg:
-            return ast.YieldFrom(
+            return make_node(
+                ast.YieldFrom,
+                get_line_range(node),
                 value=self.visit_typed(node.children[1].children[1], ast.expr),
-                **get_line_range(node),
             )
-        return ast.Yield(
-            value=self.visit_typed(node.children[1], ast.expr), **get_line_range(node)
+        return make_node(
+            ast.Yield,
+            get_line_range(node),
+            value=self.visit_typed(node.children[1], ast.expr),
         )
 
     # Leaves
     def visit_NAME(self, leaf: Leaf) -> ast.AST:
         line_range = get_line_range(leaf)
         if leaf.value == "return":
-            return ast.Return(value=None, **line_range)
+            return make_node(ast.Return, line_range, value=None)
         elif leaf.value == "pass":
-            return ast.Pass(**line_range)
+            return make_node(ast.Pass, line_range)
         elif leaf.value == "break":
-            return ast.Break(**line_range)
+            return make_node(ast.Break, line_range)
         elif leaf.value == "continue":
-            return ast.Continue(**line_range)
+            return make_node(ast.Continue, line_range)
         elif leaf.value == "yield":
-            return ast.Yield(value=None, **line_range)
+            return make_node(ast.Yield, line_range, value=None)
         elif leaf.value == "raise":
-            return ast.Raise(exc=None, cause=None, **line_range)
+            return make_node(ast.Raise, line_range, exc=None, cause=None)
         elif leaf.value == "None":
-            return ast.Constant(value=None, **line_range)
+            return make_node(ast.Constant, line_range, value=None)
         elif leaf.value == "True":
-            return ast.Constant(value=True, **line_range)
+            return make_node(ast.Constant, line_range, value=True)
         elif leaf.value == "False":
-            return ast.Constant(value=False, **line_range)
-        return ast.Name(id=leaf.value, ctx=self.expr_context, **line_range)
+            return make_node(ast.Constant, line_range, value=False)
+        return make_node(ast.Name, line_range, id=leaf.value, ctx=self.expr_context)
 
     def visit_NUMBER(self, leaf: Leaf) -> ast.Constant:
-        return ast.Constant(value=ast.literal_eval(leaf.value), **get_line_range(leaf))
+        return make_node(
+            ast.Constant, get_line_range(leaf), value=_eval_number(leaf.value)
+        )
 
     def visit_STRING(self, leaf: Leaf) -> ast.Constant:
         prefix = _string_prefix(leaf)
         kind = "u" if "u" in prefix else None
-        return ast.Constant(
-            value=ast.literal_eval(leaf.value), kind=kind, **get_line_range(leaf)
+        return make_node(
+            ast.Constant,
+            get_line_range(leaf),
+            value=_eval_string(leaf.value),
+            kind=kind,
         )
 
     def visit_COLON(self, leaf: Leaf) -> ast.Slice:
-        return ast.Slice(lower=None, upper=None, step=None, **get_line_range(leaf))
+        return make_node(
+            ast.Slice, get_line_range(leaf), lower=None, upper=None, step=None
+        )
 
     def visit_ENDMARKER(self, _leaf: Leaf) -> ast.Module:
         # empty module
@@ -1773,31 +2044,39 @@ if sys.version_info >= (3, 10):
 
         def visit_NAME(self, leaf: Leaf) -> ast.pattern:
             if leaf.value == "_":
-                return ast.MatchAs(pattern=None, name=None, **get_line_range(leaf))
+                return make_node(
+                    ast.MatchAs, get_line_range(leaf), pattern=None, name=None
+                )
             elif leaf.value == "None":
-                return ast.MatchSingleton(value=None, **get_line_range(leaf))
+                return make_node(ast.MatchSingleton, get_line_range(leaf), value=None)
             elif leaf.value == "True":
-                return ast.MatchSingleton(value=True, **get_line_range(leaf))
+                return make_node(ast.MatchSingleton, get_line_range(leaf), value=True)
             elif leaf.value == "False":
-                return ast.MatchSingleton(value=False, **get_line_range(leaf))
-            return ast.MatchAs(pattern=None, name=leaf.value, **get_line_range(leaf))
+                return make_node(ast.MatchSingleton, get_line_range(leaf), value=False)
+            return make_node(
+                ast.MatchAs, get_line_range(leaf), pattern=None, name=leaf.value
+            )
 
         def visit_STRING(self, leaf: Leaf) -> ast.pattern:
             expr = self.compiler.visit_STRING(leaf)
-            return ast.MatchValue(value=expr, **get_line_range(leaf))
+            return make_node(ast.MatchValue, get_line_range(leaf), value=expr)
 
-        visit_NUMBER = visit_STRING
+        def visit_NUMBER(self, leaf: Leaf) -> ast.pattern:
+            expr = self.compiler.visit_NUMBER(leaf)
+            return make_node(ast.MatchValue, get_line_range(leaf), value=expr)
 
         def visit_pattern(self, node: Node) -> ast.pattern:
             pattern = self.visit_typed(node.children[0], ast.pattern)
             name = extract_name(node.children[2])
-            return ast.MatchAs(pattern=pattern, name=name, **get_line_range(node))
+            return make_node(
+                ast.MatchAs, get_line_range(node), pattern=pattern, name=name
+            )
 
         def visit_patterns(self, node: Node) -> ast.pattern:
             patterns = [
                 self.visit_typed(child, ast.pattern) for child in node.children[::2]
             ]
-            return ast.MatchSequence(patterns=patterns, **get_line_range(node))
+            return make_node(ast.MatchSequence, get_line_range(node), patterns=patterns)
 
         def visit_testlist_gexp(
             self, node: Node, parent_node: Optional[Node] = None
@@ -1809,7 +2088,9 @@ if sys.version_info >= (3, 10):
             elts = [
                 self.visit_typed(child, ast.pattern) for child in node.children[::2]
             ]
-            return ast.MatchSequence(patterns=elts, **get_line_range(parent_node))
+            return make_node(
+                ast.MatchSequence, get_line_range(parent_node), patterns=elts
+            )
 
         def visit_expr(self, node: Node) -> ast.AST:
             for operator in node.children[1::2]:
@@ -1818,22 +2099,24 @@ if sys.version_info >= (3, 10):
             patterns = [
                 self.visit_typed(child, ast.pattern) for child in node.children[::2]
             ]
-            return ast.MatchOr(patterns=patterns, **get_line_range(node))
+            return make_node(ast.MatchOr, get_line_range(node), patterns=patterns)
 
         def visit_star_expr(self, node: Node) -> ast.pattern:
             name = extract_name(node.children[1])
             if name == "_":
-                return ast.MatchStar(name=None, **get_line_range(node))
-            return ast.MatchStar(name=name, **get_line_range(node))
+                return make_node(ast.MatchStar, get_line_range(node), name=None)
+            return make_node(ast.MatchStar, get_line_range(node), name=name)
 
         def visit_asexpr_test(self, node: Node) -> ast.pattern:
             pattern = self.visit_typed(node.children[0], ast.pattern)
             name = extract_name(node.children[2])
-            return ast.MatchAs(pattern=pattern, name=name, **get_line_range(node))
+            return make_node(
+                ast.MatchAs, get_line_range(node), pattern=pattern, name=name
+            )
 
         def visit_term(self, node: Node) -> ast.pattern:
             expr = self.compiler.visit_term(node)
-            return ast.MatchValue(value=expr, **get_line_range(node))
+            return make_node(ast.MatchValue, get_line_range(node), value=expr)
 
         visit_xor_expr = visit_and_expr = visit_shift_expr = visit_arith_expr = (
             visit_term
@@ -1841,12 +2124,14 @@ if sys.version_info >= (3, 10):
 
         def visit_factor(self, node: Node) -> ast.pattern:
             factor = self.compiler.visit_factor(node)
-            return ast.MatchValue(value=factor, **get_line_range(node))
+            return make_node(ast.MatchValue, get_line_range(node), value=factor)
 
         def visit_atom(self, node: Node) -> ast.pattern:
             if node.children[0].type == token.LPAR:
                 if len(node.children) == 2:
-                    return ast.MatchSequence(patterns=[], **get_line_range(node))
+                    return make_node(
+                        ast.MatchSequence, get_line_range(node), patterns=[]
+                    )
                 # tuples, parenthesized expressions
                 middle = node.children[1]
                 if isinstance(middle, Node) and middle.type == self.syms.testlist_gexp:
@@ -1854,13 +2139,16 @@ if sys.version_info >= (3, 10):
                 return self.visit(middle)
             elif node.children[0].type == token.LSQB:
                 if len(node.children) == 2:
-                    return ast.MatchSequence(patterns=[], **get_line_range(node))
+                    return make_node(
+                        ast.MatchSequence, get_line_range(node), patterns=[]
+                    )
                 # lists
                 inner = node.children[1]
                 if inner.type != self.syms.listmaker:
-                    return ast.MatchSequence(
+                    return make_node(
+                        ast.MatchSequence,
+                        get_line_range(node),
                         patterns=[self.visit_typed(inner, ast.pattern)],
-                        **get_line_range(node),
                     )
                 if inner.children[1].type == self.syms.old_comp_for:
                     raise UnsupportedSyntaxError("comprehension in pattern matching")
@@ -1868,11 +2156,15 @@ if sys.version_info >= (3, 10):
                     self.visit_typed(child, ast.pattern)
                     for child in inner.children[::2]
                 ]
-                return ast.MatchSequence(patterns=elts, **get_line_range(node))
+                return make_node(ast.MatchSequence, get_line_range(node), patterns=elts)
             elif node.children[0].type == token.LBRACE:
                 if len(node.children) == 2:
-                    return ast.MatchMapping(
-                        keys=[], patterns=[], rest=None, **get_line_range(node)
+                    return make_node(
+                        ast.MatchMapping,
+                        get_line_range(node),
+                        keys=[],
+                        patterns=[],
+                        rest=None,
                     )
                 inner = node.children[1]
                 if inner.type != self.syms.dictsetmaker:
@@ -1907,8 +2199,12 @@ if sys.version_info >= (3, 10):
                             )
                     if not consumer.done():
                         consumer.expect(token.COMMA)
-                return ast.MatchMapping(
-                    keys=keys, patterns=patterns, rest=rest, **get_line_range(node)
+                return make_node(
+                    ast.MatchMapping,
+                    get_line_range(node),
+                    keys=keys,
+                    patterns=patterns,
+                    rest=rest,
                 )
             elif node.children[0].type == token.DOT:
                 # ellipsis
@@ -1924,19 +2220,21 @@ if sys.version_info >= (3, 10):
                     else:
                         raise UnsupportedSyntaxError("f-string in pattern matching")
                 string = self._concatenate_joined_strings(strings)
-                return ast.MatchValue(value=string, **get_line_range(node))
+                return make_node(ast.MatchValue, get_line_range(node), value=string)
 
         def _concatenate_joined_strings(self, nodes: Sequence[Leaf]) -> ast.Constant:
             strings = []
             for node in nodes:
                 if node.type == token.STRING:
-                    strings.append(ast.literal_eval(node.value))
+                    strings.append(_eval_string(node.value))
                 else:
                     raise RuntimeError(f"Unexpected node: {node!r}")
             line_range = unify_line_ranges(
                 get_line_range_for_leaf(nodes[0]), get_line_range_for_leaf(nodes[-1])
             )
-            return ast.Constant(value=strings[0][:0].join(strings), **line_range)
+            return make_node(
+                ast.Constant, line_range, value=strings[0][:0].join(strings)
+            )
 
         def visit_power(self, node: Node) -> ast.pattern:
             children = node.children
@@ -1999,21 +2297,25 @@ if sys.version_info >= (3, 10):
                         pattern = self.visit_typed(pattern_node, ast.pattern)
                         name = extract_name(name_node)
                         patterns.append(
-                            ast.MatchAs(
-                                pattern=pattern, name=name, **get_line_range(argument)
+                            make_node(
+                                ast.MatchAs,
+                                get_line_range(argument),
+                                pattern=pattern,
+                                name=name,
                             )
                         )
                     else:
                         raise NotImplementedError(repr(argument))
-                return ast.MatchClass(
+                return make_node(
+                    ast.MatchClass,
+                    get_line_range(node),
                     cls=cls,
                     patterns=patterns,
                     kwd_attrs=kwd_attrs,
                     kwd_patterns=kwd_patterns,
-                    **get_line_range(node),
                 )
             elif trailer.children[0].type == token.DOT:  # subscript
                 expr = self.compiler.visit_typed(node, ast.expr)
-                return ast.MatchValue(value=expr, **get_line_range(node))
+                return make_node(ast.MatchValue, get_line_range(node), value=expr)
             else:
                 raise UnsupportedSyntaxError("trailer in pattern matching")
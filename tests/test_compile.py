@@ -1,4 +1,9 @@
 import sys
+import warnings
+
+import pytest
+from lib2toast.api import compile
+from lib2toast.compile import _eval_string
 
 from .checker import assert_compiles
 
@@ -18,6 +23,44 @@ def test_literal() -> None:
     assert_compiles('"✨ 🍰 ✨"')
     assert_compiles('u"x"')
     assert_compiles('U"x"')
+    assert_compiles(r'"\n\t\\ \x41\101 \u00e9 \N{BULLET}"')
+    assert_compiles(r'"é\n"')
+    assert_compiles(r'R"\n"')
+    assert_compiles('"a\\\nb"')
+
+
+def test_eval_string_leaves_warnings_alone() -> None:
+    def warn() -> None:
+        warnings.warn("shown once", UserWarning, stacklevel=1)
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("default")
+        filters = list(warnings.filters)
+        warn()
+        assert _eval_string(r'"a\nb"') == "a\nb"
+        assert _eval_string(r'b"\x00\n"') == b"\x00\n"
+        assert warnings.filters == filters
+        warn()
+    assert len(caught) == 1
+
+
+def test_number() -> None:
+    assert_compiles("0")
+    assert_compiles("00")
+    assert_compiles("1_000")
+    assert_compiles("0xFF")
+    assert_compiles("0XE")
+    assert_compiles("0o17")
+    assert_compiles("0b1_0")
+    assert_compiles("1.")
+    assert_compiles(".5")
+    assert_compiles("1e10")
+    assert_compiles("1E-3")
+    assert_compiles("1_0.0_1")
+    assert_compiles("1j")
+    assert_compiles("1.5J")
+    assert_compiles("1e3j")
+    assert_compiles("10**100")
 
 
 def test_cake() -> None:
@@ -103,6 +146,7 @@ def test_compare() -> None:
     assert_compiles("1 is not 2")
     assert_compiles("1 < 2 < 3")
     assert_compiles("1 < 2 <= 3")
+    assert_compiles("a is not b in c not in d != e is f")
 
 
 def test_boolop() -> None:
@@ -127,6 +171,9 @@ def test_subscript() -> None:
     assert_compiles("a[1:]")
     assert_compiles("a[:2]")
     assert_compiles("a[::2]")
+    assert_compiles("a[1::2]")
+    assert_compiles("a[:2:3]")
+    assert_compiles("a[1:2:]")
     if sys.version_info >= (3, 11):
         assert_compiles("a[*b]")
     if sys.version_info >= (3, 10):
@@ -201,6 +248,7 @@ def test_byte_string() -> None:
     assert_compiles(r"b'\x33'")
     assert_compiles(r"rb'\x33'")
     assert_compiles(r"b'\x33' b'\x44'")
+    assert_compiles(r"b'\101\n'")
 
 
 def test_lambda() -> None:
@@ -299,6 +347,14 @@ def test_yield() -> None:
 
 if sys.version_info >= (3, 12):
 
+    def test_invalid_escape_warning() -> None:
+        for code in [r'"\q"', r'b"\q"', r'"\8"', r'b"\N{BULLET}"']:
+            with pytest.warns(SyntaxWarning, match="invalid escape sequence"):
+                compile(code)
+        for code in [r'"\400"', r'b"\777"']:
+            with pytest.warns(SyntaxWarning, match="invalid octal escape sequence"):
+                compile(code)
+
     def test_type() -> None:
         assert_compiles("type x = int")
         assert_compiles("type x[T] = int")
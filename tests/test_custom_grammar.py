@@ -5,17 +5,20 @@ from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
+import lib2toast.compile as compile_mod
+import pytest
 from blib2to3 import pygram
 from blib2to3.pgen2 import token
 from blib2to3.pgen2.grammar import Grammar
-from blib2to3.pytree import NL, Node
-from lib2toast.api import load_grammar, run
+from blib2to3.pytree import NL, Leaf, Node
+from lib2toast.api import compile, load_grammar, run
 from lib2toast.compile import (
     Compiler,
     Consumer,
     LineRange,
     extract_name,
     get_line_range,
+    make_node,
     replace,
     unify_line_ranges,
 )
@@ -58,7 +61,9 @@ class BracesCompiler(Compiler):
                 if isinstance(stmt, ast.stmt):
                     statements.append(stmt)
                 elif isinstance(stmt, ast.expr):
-                    statements.append(ast.Expr(stmt, **get_line_range(node)))
+                    statements.append(
+                        make_node(ast.Expr, get_line_range(node), value=stmt)
+                    )
                 else:
                     raise AssertionError(f"Unexpected statement: {stmt}")
         return statements
@@ -146,45 +151,52 @@ class DataclassCompiler(Compiler):
         line_range = unify_line_ranges(get_line_range(node.children[0]), end_line_range)
 
         keyword_line_range = get_line_range(keyword_node)
-        dataclass = ast.Attribute(
-            value=ast.Call(
-                func=ast.Name(id="__import__", ctx=ast.Load(), **keyword_line_range),
-                args=[ast.Constant(value="dataclasses", **keyword_line_range)],
+        dataclass = make_node(
+            ast.Attribute,
+            keyword_line_range,
+            value=make_node(
+                ast.Call,
+                keyword_line_range,
+                func=make_node(
+                    ast.Name, keyword_line_range, id="__import__", ctx=ast.Load()
+                ),
+                args=[make_node(ast.Constant, keyword_line_range, value="dataclasses")],
                 keywords=[],
-                **keyword_line_range,
             ),
             attr="dataclass",
             ctx=ast.Load(),
-            **keyword_line_range,
         )
         decorator: ast.expr
         if dataclass_bases or dataclass_keywords:
-            decorator = ast.Call(
+            decorator = make_node(
+                ast.Call,
+                keyword_line_range,
                 func=dataclass,
                 args=dataclass_bases,
                 keywords=dataclass_keywords,
-                **keyword_line_range,
             )
         else:
             decorator = dataclass
         if sys.version_info >= (3, 12):
-            return ast.ClassDef(
+            return make_node(
+                ast.ClassDef,
+                line_range,
                 name=name,
                 bases=bases,
                 keywords=keywords,
                 body=suite,
                 decorator_list=[decorator],
                 type_params=type_params,
-                **line_range,
             )
         else:
-            return ast.ClassDef(
+            return make_node(
+                ast.ClassDef,
+                line_range,
                 name=name,
                 bases=bases,
                 keywords=keywords,
                 body=suite,
                 decorator_list=[decorator],
-                **line_range,
             )
 
     def visit_decorated(self, node: Node) -> ast.stmt:
@@ -250,3 +262,27 @@ def test_dataclass() -> None:
         grammar=grammar,
         compiler=compiler,
     )
+
+
+def test_visit_method_added_after_class_creation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class LateCompiler(Compiler):
+        pass
+
+    def visit_NUMBER(_self: Compiler, leaf: Leaf) -> ast.expr:
+        return make_node(ast.Constant, get_line_range(leaf), value=42)
+
+    monkeypatch.setattr(LateCompiler, "visit_NUMBER", visit_NUMBER)
+    assert run("x = 1", compiler=LateCompiler())["x"] == 42
+
+
+def test_extended_operator_tables(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(compile_mod.TOKEN_TYPE_TO_BINOP, token.PLUS, ast.Sub)
+    monkeypatch.setitem(compile_mod.NAME_TO_COMPARE_OP, "in", ast.NotIn)
+    tree = compile("a + b\na in b")
+    assert isinstance(tree, ast.Module)
+    binop, compare = (stmt.value for stmt in tree.body if isinstance(stmt, ast.Expr))
+    assert isinstance(binop, ast.BinOp) and isinstance(binop.op, ast.Sub)
+    assert isinstance(compare, ast.Compare)
+    assert [type(op) for op in compare.ops] == [ast.NotIn]